@@ -136,7 +136,7 @@ class Client:
       if not action_signature.action_type_name:
         continue
       # Strip out namespace prefixes and convert to upper case constant.
-      const_name = action_signature.action_type_name.split(".")[-1].upper()
+      const_name = action_signature.action_type_name.rpartition(".")[2].upper()
       action_type_names[const_name] = action_signature.action_type_name
     # Disable lint warnings since this is a class, not a standard attribute.
     # pylint: disable=invalid-name
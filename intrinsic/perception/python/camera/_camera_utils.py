@@ -12,24 +12,25 @@ from intrinsic.perception.proto import distortion_params_pb2
 from intrinsic.perception.proto import intrinsic_params_pb2
 import numpy as np
 
+# Drivers in the identifier oneof whose device_id can be returned as is.
+_DEVICE_ID_DRIVERS = frozenset([
+    "genicam",
+    "openni",
+    "photoneo",
+    "realsense",
+    "plenoptic_unit",
+])
+
 
 def extract_identifier(config: camera_config_pb2.CameraConfig) -> Optional[str]:
   """Extract the camera identifier from the camera config."""
   # extract device_id from oneof
   identifier = config.identifier
   camera_driver = identifier.WhichOneof("drivers")
-  if camera_driver == "genicam":
-    return identifier.genicam.device_id
-  elif camera_driver == "openni":
-    return identifier.openni.device_id
+  if camera_driver in _DEVICE_ID_DRIVERS:
+    return getattr(identifier, camera_driver).device_id
   elif camera_driver == "v4l":
     return str(identifier.v4l.device_id)
-  elif camera_driver == "photoneo":
-    return identifier.photoneo.device_id
-  elif camera_driver == "realsense":
-    return identifier.realsense.device_id
-  elif camera_driver == "plenoptic_unit":
-    return identifier.plenoptic_unit.device_id
   elif camera_driver == "fake_genicam":
     return "fake_genicam"
   else:
@@ -54,11 +55,13 @@ def extract_intrinsic_matrix(
     ip: intrinsic_params_pb2.IntrinsicParams,
 ) -> np.ndarray:
   """Extract intrinsic matrix from intrinsic params as a numpy array."""
-  return np.array([
-      [ip.focal_length_x, 0, ip.principal_point_x],
-      [0, ip.focal_length_y, ip.principal_point_y],
-      [0, 0, 1],
-  ])
+  intrinsic_matrix = np.zeros((3, 3))
+  intrinsic_matrix[0, 0] = ip.focal_length_x
+  intrinsic_matrix[0, 2] = ip.principal_point_x
+  intrinsic_matrix[1, 1] = ip.focal_length_y
+  intrinsic_matrix[1, 2] = ip.principal_point_y
+  intrinsic_matrix[2, 2] = 1.0
+  return intrinsic_matrix
 
 
 def extract_distortion_params(
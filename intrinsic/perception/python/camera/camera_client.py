@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import grpc
 from intrinsic.perception.proto import camera_config_pb2
@@ -15,7 +15,6 @@ from intrinsic.perception.proto import capture_result_pb2
 from intrinsic.perception.service.proto import camera_server_pb2
 from intrinsic.perception.service.proto import camera_server_pb2_grpc
 from intrinsic.util.grpc import connection
-from intrinsic.util.grpc import interceptor
 
 
 class CameraClient:
@@ -28,6 +27,7 @@ class CameraClient:
   camera_config: camera_config_pb2.CameraConfig
   _camera_stub: camera_server_pb2_grpc.CameraServerStub
   _camera_handle: str
+  _metadata: Optional[List[Tuple[str, str]]]
 
   def __init__(
       self,
@@ -35,21 +35,38 @@ class CameraClient:
       connection_params: connection.ConnectionParams,
       camera_config: camera_config_pb2.CameraConfig,
   ):
-    """Creates a CameraClient object."""
+    """Creates a CameraClient object.
+
+    Captured images are usually larger than gRPC's default 4 MB receive limit,
+    so the channel should be created with an unlimited receive message length,
+    e.g. `options=[("grpc.max_receive_message_length", -1)]`.
+
+    Args:
+      camera_channel: The channel to the camera server.
+      connection_params: The connection params used to route calls to the
+        camera server.
+      camera_config: The config of the camera to create.
+
+    Raises:
+      RuntimeError: The camera could not be created.
+      grpc.RpcError: A gRPC error occurred.
+    """
     self.camera_config = camera_config
 
-    # Create stub.
-    intercepted_camera_channel = grpc.intercept_channel(
-        camera_channel,
-        interceptor.HeaderAdderInterceptor(connection_params.headers),
-    )
-    self._camera_stub = camera_server_pb2_grpc.CameraServerStub(
-        intercepted_camera_channel
+    # Create stub. The routing headers are fixed for the lifetime of the
+    # client, so they are passed as call metadata instead of through an
+    # interceptor. gRPC rejects metadata keys that are not lower case.
+    headers = connection_params.headers()
+    self._metadata = (
+        [(header.lower(), value) for header, value in headers]
+        if headers
+        else None
     )
+    self._camera_stub = camera_server_pb2_grpc.CameraServerStub(camera_channel)
 
     # Access a camera instance.
     request = camera_server_pb2.CreateCameraRequest(camera_config=camera_config)
-    response = self._camera_stub.CreateCamera(request)
+    response = self._camera_stub.CreateCamera(request, metadata=self._metadata)
     self._camera_handle = response.camera_handle
 
     if not self._camera_handle:
@@ -70,7 +87,9 @@ class CameraClient:
     request = camera_server_pb2.DescribeCameraRequest(
         camera_handle=self._camera_handle
     )
-    response = self._camera_stub.DescribeCamera(request)
+    response = self._camera_stub.DescribeCamera(
+        request, metadata=self._metadata
+    )
     return response
 
   def capture(
@@ -107,7 +126,7 @@ class CameraClient:
       request.timeout.FromTimedelta(timeout)
     if sensor_ids is not None:
       request.sensor_ids[:] = sensor_ids
-    response = self._camera_stub.Capture(request)
+    response = self._camera_stub.Capture(request, metadata=self._metadata)
     return response.capture_result
 
   def read_camera_setting_properties(
@@ -137,7 +156,9 @@ class CameraClient:
         camera_handle=self._camera_handle,
         name=name,
     )
-    response = self._camera_stub.ReadCameraSettingProperties(request)
+    response = self._camera_stub.ReadCameraSettingProperties(
+        request, metadata=self._metadata
+    )
     return response.properties
 
   def read_camera_setting(
@@ -162,7 +183,9 @@ class CameraClient:
         camera_handle=self._camera_handle,
         name=name,
     )
-    response = self._camera_stub.ReadCameraSetting(request)
+    response = self._camera_stub.ReadCameraSetting(
+        request, metadata=self._metadata
+    )
     return response.setting
 
   def update_camera_setting(
@@ -186,7 +209,7 @@ class CameraClient:
         camera_handle=self._camera_handle,
         setting=setting,
     )
-    self._camera_stub.UpdateCameraSetting(request)
+    self._camera_stub.UpdateCameraSetting(request, metadata=self._metadata)
 
   def read_camera_params(self) -> camera_params_pb2.CameraParams:
     """Returns a camera's intrinsic and distortion parameters.
@@ -204,7 +227,9 @@ class CameraClient:
     request = camera_server_pb2.ReadCameraParamsRequest(
         camera_handle=self._camera_handle,
     )
-    response = self._camera_stub.ReadCameraParams(request)
+    response = self._camera_stub.ReadCameraParams(
+        request, metadata=self._metadata
+    )
     return response.camera_params
 
   def update_camera_params(
@@ -226,7 +251,7 @@ class CameraClient:
         camera_handle=self._camera_handle,
         camera_params=camera_params,
     )
-    self._camera_stub.UpdateCameraParams(request)
+    self._camera_stub.UpdateCameraParams(request, metadata=self._metadata)
 
   def clear_camera_params(self) -> None:
     """Removes camera parameters.
@@ -239,4 +264,4 @@ class CameraClient:
     request = camera_server_pb2.ClearCameraParamsRequest(
         camera_handle=self._camera_handle,
     )
-    self._camera_stub.ClearCameraParams(request)
+    self._camera_stub.ClearCameraParams(request, metadata=self._metadata)
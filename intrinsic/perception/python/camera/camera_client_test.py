@@ -0,0 +1,65 @@
+# Copyright 2023 Intrinsic Innovation LLC
+
+"""Tests for intrinsic.perception.python.camera.camera_client."""
+
+from unittest import mock
+
+from absl.testing import absltest
+from intrinsic.perception.proto import camera_config_pb2
+from intrinsic.perception.python.camera import camera_client
+from intrinsic.perception.service.proto import camera_server_pb2
+from intrinsic.perception.service.proto import camera_server_pb2_grpc
+from intrinsic.util.grpc import connection
+
+
+class CameraClientTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self._stub = mock.MagicMock()
+    self._stub.CreateCamera.return_value = (
+        camera_server_pb2.CreateCameraResponse(camera_handle="handle")
+    )
+    self.enter_context(
+        mock.patch.object(
+            camera_server_pb2_grpc,
+            "CameraServerStub",
+            return_value=self._stub,
+        )
+    )
+
+  def test_sends_lower_case_routing_headers_as_metadata(self):
+    connection_params = connection.ConnectionParams(
+        "localhost:1234", "camera-instance", "X-Resource-Instance-Name"
+    )
+
+    client = camera_client.CameraClient(
+        mock.MagicMock(), connection_params, camera_config_pb2.CameraConfig()
+    )
+    client.describe_camera()
+
+    expected_metadata = [("x-resource-instance-name", "camera-instance")]
+    self.assertEqual(
+        self._stub.CreateCamera.call_args.kwargs["metadata"], expected_metadata
+    )
+    self.assertEqual(
+        self._stub.DescribeCamera.call_args.kwargs["metadata"],
+        expected_metadata,
+    )
+
+  def test_sends_no_metadata_without_ingress(self):
+    connection_params = connection.ConnectionParams.no_ingress(
+        "localhost:1234"
+    )
+
+    client = camera_client.CameraClient(
+        mock.MagicMock(), connection_params, camera_config_pb2.CameraConfig()
+    )
+    client.describe_camera()
+
+    self.assertIsNone(self._stub.CreateCamera.call_args.kwargs["metadata"])
+    self.assertIsNone(self._stub.DescribeCamera.call_args.kwargs["metadata"])
+
+
+if __name__ == "__main__":
+  absltest.main()
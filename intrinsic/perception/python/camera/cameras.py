@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import datetime
 from typing import List, Mapping, Optional, Tuple, Union
+import weakref
 
 from absl import logging
 from google.protobuf import empty_pb2
@@ -14,6 +15,7 @@ from intrinsic.hardware.proto import settings_pb2
 from intrinsic.math.python import pose3
 from intrinsic.perception.proto import camera_config_pb2
 from intrinsic.perception.proto import camera_params_pb2
+from intrinsic.perception.proto import camera_settings_pb2
 from intrinsic.perception.python.camera import camera_client
 from intrinsic.perception.python.camera import data_classes
 from intrinsic.resources.proto import resource_handle_pb2
@@ -27,6 +29,37 @@ import numpy as np
 
 _CONFIG_EQUIPMENT_IDENTIFIER = "CameraConfig"
 
+# Fields of the setting_properties oneof that can be returned as is.
+_SETTING_PROPERTIES_FIELDS = frozenset(
+    ["float_properties", "integer_properties", "enum_properties"]
+)
+
+# Fields of the camera setting value oneof that can be returned as is.
+_SETTING_VALUE_FIELDS = frozenset([
+    "integer_value",
+    "float_value",
+    "bool_value",
+    "string_value",
+    "enumeration_value",
+])
+
+# Channels to camera servers by address, shared by all Camera instances that
+# connect to the same server. A channel is dropped once no Camera uses it.
+_camera_channels: weakref.WeakValueDictionary[str, grpc.Channel] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_camera_channel(address: str) -> grpc.Channel:
+  """Returns a shared channel to the camera server at the given address."""
+  camera_channel = _camera_channels.get(address)
+  if camera_channel is None:
+    # use unlimited message size for receiving images (e.g. -1)
+    options = [("grpc.max_receive_message_length", -1)]
+    camera_channel = grpc.insecure_channel(address, options=options)
+    _camera_channels[address] = camera_channel
+  return camera_channel
+
 
 def _unpack_camera_config(
     camera_equipment: resource_handle_pb2.ResourceHandle,
@@ -114,8 +147,11 @@ class Camera:
   _camera_equipment: resource_handle_pb2.ResourceHandle
   _world_client: Optional[object_world_client.ObjectWorldClient]
   _world_object: Optional[object_world_resources.WorldObject]
+  _channel: grpc.Channel
   _client: camera_client.CameraClient
   _sensor_id_to_name: Mapping[int, str]
+  _sensor_name_to_id: Mapping[str, int]
+  _setting_value_types: dict[str, str]
 
   config: data_classes.CameraConfig
   factory_config: Optional[data_classes.CameraConfig]
@@ -188,11 +224,12 @@ class Camera:
         else None
     )
     self._sensor_id_to_name = {}
+    self._sensor_name_to_id = {}
+    self._setting_value_types = {}
 
-    # use unlimited message size for receiving images (e.g. -1)
-    options = [("grpc.max_receive_message_length", -1)]
     grpc_info = camera_equipment.connection_info.grpc
-    camera_channel = grpc.insecure_channel(grpc_info.address, options=options)
+    # Keep a reference to the shared channel for the lifetime of the camera.
+    self._channel = _get_camera_channel(grpc_info.address)
     connection_params = connection.ConnectionParams(
         grpc_info.address, grpc_info.server_instance, grpc_info.header
     )
@@ -203,7 +240,7 @@ class Camera:
       raise RuntimeError("Could not parse camera config from resource handle.")
 
     self._client = camera_client.CameraClient(
-        camera_channel, connection_params, camera_config
+        self._channel, connection_params, camera_config
     )
 
     self.config = data_classes.CameraConfig(camera_config)
@@ -224,10 +261,14 @@ class Camera:
 
       # map sensor_ids to human readable sensor names from camera description
       # for capture result
-      self._sensor_id_to_name = {
-          sensor_info.sensor_id: sensor_name
+      self._sensor_name_to_id = {
+          sensor_name: sensor_info.sensor_id
           for sensor_name, sensor_info in self.factory_sensor_info.items()
       }
+      self._sensor_id_to_name = {
+          sensor_id: sensor_name
+          for sensor_name, sensor_id in self._sensor_name_to_id.items()
+      }
     except grpc.RpcError:
       logging.warning("Could not load factory configuration.")
 
@@ -254,10 +295,7 @@ class Camera:
   @property
   def sensor_ids(self) -> List[int]:
     """List of sensor ids."""
-    return [
-        sensor_info.sensor_id
-        for _, sensor_info in self.factory_sensor_info.items()
-    ]
+    return list(self._sensor_name_to_id.values())
 
   @property
   def sensor_dimensions(self) -> Mapping[str, Tuple[int, int]]:
@@ -267,6 +305,27 @@ class Camera:
         for sensor_name, sensor_info in self.factory_sensor_info.items()
     }
 
+  def _sensor_info_and_config(
+      self, sensor_name: str
+  ) -> Tuple[
+      Optional[data_classes.SensorInformation],
+      Optional[data_classes.SensorConfig],
+  ]:
+    """Returns the factory info and configured settings of a sensor.
+
+    Args:
+      sensor_name: The desired sensor's name.
+
+    Returns:
+      The sensor's factory information, or None if the sensor is unknown, and
+      its sensor config, or None if the camera config has no entry for it.
+    """
+    sensor_info = self.factory_sensor_info.get(sensor_name)
+    if sensor_info is None:
+      return None, None
+    sensor_config = self.config.sensor_configs.get(sensor_info.sensor_id)
+    return sensor_info, sensor_config
+
   def intrinsic_matrix(
       self, sensor_name: Optional[str] = None
   ) -> Optional[np.ndarray]:
@@ -282,26 +341,18 @@ class Camera:
     if sensor_name is None:
       return self.config.intrinsic_matrix
 
-    if sensor_name not in self.factory_sensor_info:
+    sensor_info, sensor_config = self._sensor_info_and_config(sensor_name)
+    if sensor_info is None:
       return None
-    sensor_info = self.factory_sensor_info[sensor_name]
-    sensor_id = sensor_info.sensor_id
-
-    sensor_config = (
-        self.config.sensor_configs[sensor_id]
-        if sensor_id in self.config.sensor_configs
-        else None
-    )
 
-    if sensor_config is not None and sensor_config.intrinsic_matrix is not None:
-      return sensor_config.intrinsic_matrix
-    elif (
-        sensor_info is not None
-        and sensor_info.factory_intrinsic_matrix is not None
-    ):
-      return sensor_info.factory_intrinsic_matrix
-    else:
-      return self.config.intrinsic_matrix
+    if sensor_config is not None:
+      intrinsic_matrix = sensor_config.intrinsic_matrix
+      if intrinsic_matrix is not None:
+        return intrinsic_matrix
+    intrinsic_matrix = sensor_info.factory_intrinsic_matrix
+    if intrinsic_matrix is not None:
+      return intrinsic_matrix
+    return self.config.intrinsic_matrix
 
   def distortion_params(
       self, sensor_name: Optional[str] = None
@@ -319,29 +370,18 @@ class Camera:
     if sensor_name is None:
       return self.config.distortion_params
 
-    if sensor_name not in self.factory_sensor_info:
+    sensor_info, sensor_config = self._sensor_info_and_config(sensor_name)
+    if sensor_info is None:
       return None
-    sensor_info = self.factory_sensor_info[sensor_name]
-    sensor_id = sensor_info.sensor_id
 
-    sensor_config = (
-        self.config.sensor_configs[sensor_id]
-        if sensor_id in self.config.sensor_configs
-        else None
-    )
-
-    if (
-        sensor_config is not None
-        and sensor_config.distortion_params is not None
-    ):
-      return sensor_config.distortion_params
-    elif (
-        sensor_info is not None
-        and sensor_info.factory_distortion_params is not None
-    ):
-      return sensor_info.factory_distortion_params
-    else:
-      return self.config.distortion_params
+    if sensor_config is not None:
+      distortion_params = sensor_config.distortion_params
+      if distortion_params is not None:
+        return distortion_params
+    distortion_params = sensor_info.factory_distortion_params
+    if distortion_params is not None:
+      return distortion_params
+    return self.config.distortion_params
 
   @property
   def world_object(self) -> Optional[object_world_resources.WorldObject]:
@@ -368,23 +408,15 @@ class Camera:
       The pose3.Pose3 of the sensor relative to the pose of the camera itself or
         None if it couldn't be found.
     """
-    if sensor_name not in self.factory_sensor_info:
+    sensor_info, sensor_config = self._sensor_info_and_config(sensor_name)
+    if sensor_info is None:
       return None
-    sensor_info = self.factory_sensor_info[sensor_name]
-    sensor_id = sensor_info.sensor_id
 
-    sensor_config = (
-        self.config.sensor_configs[sensor_id]
-        if sensor_id in self.config.sensor_configs
-        else None
-    )
-
-    if sensor_config is not None and sensor_config.camera_t_sensor is not None:
-      return sensor_config.camera_t_sensor
-    elif sensor_info is not None and sensor_info.camera_t_sensor is not None:
-      return sensor_info.camera_t_sensor
-    else:
-      return None
+    if sensor_config is not None:
+      camera_t_sensor = sensor_config.camera_t_sensor
+      if camera_t_sensor is not None:
+        return camera_t_sensor
+    return sensor_info.camera_t_sensor
 
   def world_t_sensor(self, sensor_name: str) -> Optional[pose3.Pose3]:
     """Get the sensor world_t_sensor pose, falling back to factory settings for camera_t_sensor if pose is missing from the sensor config.
@@ -493,9 +525,9 @@ class Camera:
               "No factory sensor info found, cannot find sensor id for"
               f" {sensor_name}"
           )
-        if sensor_name not in self.factory_sensor_info:
+        if sensor_name not in self._sensor_name_to_id:
           raise ValueError(f"Invalid sensor name: {sensor_name}")
-        sensor_ids = [self.factory_sensor_info[sensor_name].sensor_id]
+        sensor_ids = [self._sensor_name_to_id[sensor_name]]
       else:
         sensor_ids = None
 
@@ -552,10 +584,9 @@ class Camera:
           )
         sensor_ids: List[int] = []
         for sensor_name in sensor_names:
-          if sensor_name not in self.factory_sensor_info:
+          if sensor_name not in self._sensor_name_to_id:
             raise ValueError(f"Invalid sensor name: {sensor_name}")
-          sensor_id = self.factory_sensor_info[sensor_name].sensor_id
-          sensor_ids.append(sensor_id)
+          sensor_ids.append(self._sensor_name_to_id[sensor_name])
       else:
         sensor_ids = None
 
@@ -603,16 +634,11 @@ class Camera:
       setting_properties = camera_setting_properties_proto.WhichOneof(
           "setting_properties"
       )
-      if setting_properties == "float_properties":
-        return camera_setting_properties_proto.float_properties
-      elif setting_properties == "integer_properties":
-        return camera_setting_properties_proto.integer_properties
-      elif setting_properties == "enum_properties":
-        return camera_setting_properties_proto.enum_properties
-      else:
+      if setting_properties not in _SETTING_PROPERTIES_FIELDS:
         raise ValueError(
             f"Could not parse setting_properties: {setting_properties}."
         )
+      return getattr(camera_setting_properties_proto, setting_properties)
     except grpc.RpcError as e:
       logging.warning("Could not read camera setting properties.")
       raise e
@@ -642,16 +668,8 @@ class Camera:
       camera_setting_proto = self._client.read_camera_setting(name=name)
 
       value = camera_setting_proto.WhichOneof("value")
-      if value == "integer_value":
-        return camera_setting_proto.integer_value
-      elif value == "float_value":
-        return camera_setting_proto.float_value
-      elif value == "bool_value":
-        return camera_setting_proto.bool_value
-      elif value == "string_value":
-        return camera_setting_proto.string_value
-      elif value == "enumeration_value":
-        return camera_setting_proto.enumeration_value
+      if value in _SETTING_VALUE_FIELDS:
+        return getattr(camera_setting_proto, value)
       elif value == "command_value":
         return "command"
       else:
@@ -682,10 +700,14 @@ class Camera:
     """
     try:
       # Cannot get sufficient type information from just
-      # `Union[int, float, bool, str]`, so read the setting first and then
-      # update its value.
-      setting = self._client.read_camera_setting(name=name)
-      value_type = setting.WhichOneof("value")
+      # `Union[int, float, bool, str]`, so read the setting the first time it
+      # is updated and remember its value type for later updates.
+      value_type = self._setting_value_types.get(name)
+      if value_type is None:
+        value_type = self._client.read_camera_setting(name=name).WhichOneof(
+            "value"
+        )
+      setting = camera_settings_pb2.CameraSetting(name=name)
       if value_type == "integer_value":
         if not isinstance(value, int):
           raise ValueError(f"Expected int value for {name} but got '{value}'")
@@ -720,7 +742,9 @@ class Camera:
         raise ValueError(f"Could not parse value: {value_type}.")
 
       self._client.update_camera_setting(setting=setting)
+      self._setting_value_types[name] = value_type
     except grpc.RpcError as e:
+      self._setting_value_types.pop(name, None)
       logging.warning("Could not update camera setting.")
       raise e
 
@@ -0,0 +1,194 @@
+# Copyright 2023 Intrinsic Innovation LLC
+
+"""Tests for intrinsic.perception.python.camera.cameras."""
+
+import gc
+from unittest import mock
+import weakref
+
+from absl.testing import absltest
+import grpc
+from intrinsic.perception.proto import camera_config_pb2
+from intrinsic.perception.proto import camera_settings_pb2
+from intrinsic.perception.python.camera import camera_client
+from intrinsic.perception.python.camera import cameras
+from intrinsic.perception.service.proto import camera_server_pb2
+from intrinsic.resources.proto import resource_handle_pb2
+
+
+def _make_resource_handle(
+    name: str, address: str
+) -> resource_handle_pb2.ResourceHandle:
+  resource_handle = resource_handle_pb2.ResourceHandle(name=name)
+  resource_handle.connection_info.grpc.address = address
+  resource_handle.resource_data["CameraConfig"].contents.Pack(
+      camera_config_pb2.CameraConfig()
+  )
+  return resource_handle
+
+
+class CameraTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self._client = mock.create_autospec(
+        camera_client.CameraClient, instance=True
+    )
+    self._client.describe_camera.return_value = (
+        camera_server_pb2.DescribeCameraResponse()
+    )
+    self.enter_context(
+        mock.patch.object(
+            camera_client, "CameraClient", return_value=self._client
+        )
+    )
+    self.enter_context(
+        mock.patch.object(
+            cameras, "_get_camera_channel", return_value=mock.MagicMock()
+        )
+    )
+
+    self._camera = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera", "localhost:1234")
+    )
+
+  def test_update_camera_setting_reads_setting_type_once(self):
+    self._client.read_camera_setting.return_value = (
+        camera_settings_pb2.CameraSetting(name="ExposureTime", float_value=1.0)
+    )
+
+    self._camera.update_camera_setting("ExposureTime", 2.0)
+    self._camera.update_camera_setting("ExposureTime", 3)
+
+    self._client.read_camera_setting.assert_called_once_with(
+        name="ExposureTime"
+    )
+    self._client.update_camera_setting.assert_called_with(
+        setting=camera_settings_pb2.CameraSetting(
+            name="ExposureTime", float_value=3.0
+        )
+    )
+    self.assertEqual(self._client.update_camera_setting.call_count, 2)
+
+  def test_update_camera_setting_reads_setting_again_after_rpc_error(self):
+    self._client.read_camera_setting.return_value = (
+        camera_settings_pb2.CameraSetting(name="Gain", integer_value=1)
+    )
+    self._client.update_camera_setting.side_effect = [
+        None,
+        grpc.RpcError(),
+        None,
+    ]
+
+    self._camera.update_camera_setting("Gain", 2)
+    with self.assertRaises(grpc.RpcError):
+      self._camera.update_camera_setting("Gain", 3)
+    self.assertEqual(self._client.read_camera_setting.call_count, 1)
+
+    self._camera.update_camera_setting("Gain", 4)
+
+    self.assertEqual(self._client.read_camera_setting.call_count, 2)
+    self._client.update_camera_setting.assert_called_with(
+        setting=camera_settings_pb2.CameraSetting(name="Gain", integer_value=4)
+    )
+
+  def test_update_camera_setting_type_mismatch_does_not_poison_cache(self):
+    self._client.read_camera_setting.return_value = (
+        camera_settings_pb2.CameraSetting(name="Gain", integer_value=1)
+    )
+
+    with self.assertRaises(ValueError):
+      self._camera.update_camera_setting("Gain", "high")
+    self._client.update_camera_setting.assert_not_called()
+
+    # The failed update must not have cached a type, so the setting is read
+    # again.
+    self._camera.update_camera_setting("Gain", 2)
+    self.assertEqual(self._client.read_camera_setting.call_count, 2)
+
+    # A mismatch on a cached setting keeps the cached type.
+    with self.assertRaises(ValueError):
+      self._camera.update_camera_setting("Gain", "high")
+    self._camera.update_camera_setting("Gain", 3)
+
+    self.assertEqual(self._client.read_camera_setting.call_count, 2)
+    self._client.update_camera_setting.assert_called_with(
+        setting=camera_settings_pb2.CameraSetting(name="Gain", integer_value=3)
+    )
+    self.assertEqual(self._client.update_camera_setting.call_count, 2)
+
+
+class CameraChannelTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    client = mock.create_autospec(camera_client.CameraClient, instance=True)
+    client.describe_camera.return_value = (
+        camera_server_pb2.DescribeCameraResponse()
+    )
+    self._client_class = self.enter_context(
+        mock.patch.object(camera_client, "CameraClient", return_value=client)
+    )
+    self._insecure_channel = self.enter_context(
+        mock.patch.object(
+            grpc,
+            "insecure_channel",
+            side_effect=lambda *args, **kwargs: mock.MagicMock(),
+        )
+    )
+    self.enter_context(
+        mock.patch.object(
+            cameras, "_camera_channels", weakref.WeakValueDictionary()
+        )
+    )
+
+  def test_cameras_with_same_address_share_channel(self):
+    camera_a = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_a", "localhost:1234")
+    )
+    camera_b = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_b", "localhost:1234")
+    )
+
+    self._insecure_channel.assert_called_once_with(
+        "localhost:1234", options=[("grpc.max_receive_message_length", -1)]
+    )
+    self.assertIs(camera_a._channel, camera_b._channel)
+
+  def test_cameras_with_different_addresses_get_separate_channels(self):
+    camera_a = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_a", "localhost:1234")
+    )
+    camera_b = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_b", "localhost:5678")
+    )
+
+    self.assertEqual(self._insecure_channel.call_count, 2)
+    self.assertIsNot(camera_a._channel, camera_b._channel)
+
+  def test_channel_is_dropped_once_no_camera_uses_it(self):
+    camera_a = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_a", "localhost:1234")
+    )
+    camera_b = cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_b", "localhost:1234")
+    )
+
+    del camera_a
+    gc.collect()
+    self.assertIn("localhost:1234", cameras._camera_channels)
+
+    del camera_b
+    # The mocked CameraClient class records the channel in its call args.
+    self._client_class.reset_mock()
+    gc.collect()
+    self.assertNotIn("localhost:1234", cameras._camera_channels)
+
+    cameras.Camera.create_from_resource_handle(
+        _make_resource_handle("camera_c", "localhost:1234")
+    )
+    self.assertEqual(self._insecure_channel.call_count, 2)
+
+
+if __name__ == "__main__":
+  absltest.main()
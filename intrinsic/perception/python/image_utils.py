@@ -3,36 +3,42 @@
 """Miscellaneous image helper methods."""
 
 import io
-from typing import Optional, Tuple, Type, Union
+from typing import Optional, Tuple, Union
 
 from intrinsic.perception.proto import image_buffer_pb2
 import numpy as np
 from PIL import Image
 
+# Maps image buffer data types to numpy dtypes, built once at import time.
+_DATA_TYPE_TO_DTYPE = {
+    image_buffer_pb2.DataType.TYPE_8U: np.dtype(np.uint8),
+    image_buffer_pb2.DataType.TYPE_16U: np.dtype(np.uint16),
+    image_buffer_pb2.DataType.TYPE_32U: np.dtype(np.uint32),
+    image_buffer_pb2.DataType.TYPE_8S: np.dtype(np.int8),
+    image_buffer_pb2.DataType.TYPE_16S: np.dtype(np.int16),
+    image_buffer_pb2.DataType.TYPE_32S: np.dtype(np.int32),
+    image_buffer_pb2.DataType.TYPE_32F: np.dtype(np.float32),
+    image_buffer_pb2.DataType.TYPE_64F: np.dtype(np.float64),
+}
+
+# Maps image buffer encodings to PIL image formats; None means unencoded.
+_ENCODING_TO_IMAGE_FORMAT = {
+    image_buffer_pb2.ENCODING_UNSPECIFIED: None,
+    image_buffer_pb2.ENCODING_JPEG: "JPEG",
+    image_buffer_pb2.ENCODING_PNG: "PNG",
+    image_buffer_pb2.ENCODING_WEBP: "WEBP",
+}
+
 
 def _image_buffer_data_type(
     image_buffer: image_buffer_pb2.ImageBuffer,
-) -> Union[np.dtype, Type[np.generic]]:
+) -> np.dtype:
   """Returns the data type of the given image buffer."""
   data_type = image_buffer.type
-  if data_type == image_buffer_pb2.DataType.TYPE_8U:
-    return np.uint8
-  elif data_type == image_buffer_pb2.DataType.TYPE_16U:
-    return np.uint16
-  elif data_type == image_buffer_pb2.DataType.TYPE_32U:
-    return np.uint32
-  elif data_type == image_buffer_pb2.DataType.TYPE_8S:
-    return np.int8
-  elif data_type == image_buffer_pb2.DataType.TYPE_16S:
-    return np.int16
-  elif data_type == image_buffer_pb2.DataType.TYPE_32S:
-    return np.int32
-  elif data_type == image_buffer_pb2.DataType.TYPE_32F:
-    return np.float32
-  elif data_type == image_buffer_pb2.DataType.TYPE_64F:
-    return np.float64
-  else:
+  dtype = _DATA_TYPE_TO_DTYPE.get(data_type)
+  if dtype is None:
     raise ValueError(f"Data type not supported: {data_type}.")
+  return dtype
 
 
 def _image_buffer_encoding(
@@ -40,60 +46,54 @@ def _image_buffer_encoding(
 ) -> Optional[str]:
   """Returns the encoding of the given image buffer."""
   encoding = image_buffer.encoding
-  if encoding == image_buffer_pb2.ENCODING_UNSPECIFIED:
-    return None
-  elif encoding == image_buffer_pb2.ENCODING_JPEG:
-    return "JPEG"
-  elif encoding == image_buffer_pb2.ENCODING_PNG:
-    return "PNG"
-  elif encoding == image_buffer_pb2.ENCODING_WEBP:
-    return "WEBP"
-  else:
+  if encoding not in _ENCODING_TO_IMAGE_FORMAT:
     raise ValueError(
         f"Encoding not supported: {image_buffer_pb2.Encoding.Name(encoding)}."
     )
+  return _ENCODING_TO_IMAGE_FORMAT[encoding]
 
 
 def _image_buffer_decoded(
     image_buffer: image_buffer_pb2.ImageBuffer,
+    data: bytes,
+    size: int,
 ) -> np.ndarray:
+  """Returns the flat or decoded pixel data of the given image buffer.
+
+  Args:
+    image_buffer: The serialized image.
+    data: The contents of image_buffer.data.
+    size: The expected number of elements in the image.
+
+  Raises:
+    ValueError if the size of unencoded data does not match the image size.
+  """
   encoding = _image_buffer_encoding(image_buffer)
   if encoding is None:
-    return np.frombuffer(
-        image_buffer.data, dtype=_image_buffer_data_type(image_buffer)
-    )
+    dtype = _image_buffer_data_type(image_buffer)
+    expected_num_bytes = size * dtype.itemsize
+    if len(data) != expected_num_bytes:
+      raise ValueError(
+          "Invalid buffer size %d != %d bytes" % (len(data), expected_num_bytes)
+      )
+    return np.frombuffer(data, dtype=dtype)
   else:
-    return np.asarray(
-        Image.open(io.BytesIO(image_buffer.data), formats=[encoding])
-    )
+    return np.asarray(Image.open(io.BytesIO(data), formats=[encoding]))
 
 
-def _image_buffer_shape(
+def _image_buffer_shape_and_size(
     image_buffer: image_buffer_pb2.ImageBuffer,
-) -> Union[Tuple[int, int], Tuple[int, int, int]]:
-  """Returns the shape of the given image buffer."""
-  if image_buffer.num_channels == 1:
-    return (
-        image_buffer.dimensions.rows,
-        image_buffer.dimensions.cols,
-    )
+    num_channels: int,
+) -> Tuple[Union[Tuple[int, int], Tuple[int, int, int]], int]:
+  """Returns the shape and number of elements of the given image buffer."""
+  dimensions = image_buffer.dimensions
+  rows = dimensions.rows
+  cols = dimensions.cols
+  if num_channels == 1:
+    shape = (rows, cols)
   else:
-    return (
-        image_buffer.dimensions.rows,
-        image_buffer.dimensions.cols,
-        image_buffer.num_channels,
-    )
-
-
-def _image_buffer_size(
-    image_buffer: image_buffer_pb2.ImageBuffer,
-) -> int:
-  """Returns the number of elements in the given image buffer."""
-  return (
-      image_buffer.dimensions.rows
-      * image_buffer.dimensions.cols
-      * image_buffer.num_channels
-  )
+    shape = (rows, cols, num_channels)
+  return shape, rows * cols * num_channels
 
 
 def deserialize_image_buffer(
@@ -114,19 +114,17 @@ def deserialize_image_buffer(
   Raises:
     ValueError if the buffer size is invalid.
   """
-  if not image.data:
+  data = image.data
+  if not data:
     raise ValueError("No image buffer data provided.")
 
-  pixel_type = image.pixel_type
-  num_channels = image.num_channels
-  if pixel_type == image_buffer_pb2.PixelType.PIXEL_POINT:
+  if image.pixel_type == image_buffer_pb2.PixelType.PIXEL_POINT:
     num_channels = 3
+  else:
+    num_channels = image.num_channels
 
-  image.num_channels = num_channels
-
-  buffer = _image_buffer_decoded(image)
-  shape = _image_buffer_shape(image)
-  size = _image_buffer_size(image)
+  shape, size = _image_buffer_shape_and_size(image, num_channels)
+  buffer = _image_buffer_decoded(image, data, size)
 
   if buffer.size != size:
     raise ValueError("Invalid buffer size %d != %d" % (buffer.size, size))
@@ -0,0 +1,96 @@
+# Copyright 2023 Intrinsic Innovation LLC
+
+"""Tests for intrinsic.perception.python.image_utils."""
+
+from absl.testing import absltest
+from intrinsic.perception.proto import image_buffer_pb2
+from intrinsic.perception.python import image_utils
+import numpy as np
+
+
+def _make_image_buffer(
+    array: np.ndarray,
+    pixel_type: image_buffer_pb2.PixelType,
+    data_type: image_buffer_pb2.DataType,
+    num_channels: int,
+) -> image_buffer_pb2.ImageBuffer:
+  image = image_buffer_pb2.ImageBuffer(
+      pixel_type=pixel_type,
+      num_channels=num_channels,
+      type=data_type,
+      data=array.tobytes(),
+  )
+  image.dimensions.rows = array.shape[0]
+  image.dimensions.cols = array.shape[1]
+  return image
+
+
+class ImageUtilsTest(absltest.TestCase):
+
+  def test_deserialize_image_buffer_intensity(self):
+    array = np.arange(2 * 3 * 3, dtype=np.uint8).reshape((2, 3, 3))
+    image = _make_image_buffer(
+        array,
+        image_buffer_pb2.PixelType.PIXEL_INTENSITY,
+        image_buffer_pb2.DataType.TYPE_8U,
+        num_channels=3,
+    )
+
+    result = image_utils.deserialize_image_buffer(image)
+
+    np.testing.assert_array_equal(result, array)
+
+  def test_deserialize_image_buffer_single_channel(self):
+    array = np.arange(2 * 3, dtype=np.float32).reshape((2, 3))
+    image = _make_image_buffer(
+        array,
+        image_buffer_pb2.PixelType.PIXEL_DEPTH,
+        image_buffer_pb2.DataType.TYPE_32F,
+        num_channels=1,
+    )
+
+    result = image_utils.deserialize_image_buffer(image)
+
+    self.assertEqual(result.dtype, np.float32)
+    np.testing.assert_array_equal(result, array)
+
+  def test_deserialize_image_buffer_point_cloud_does_not_modify_proto(self):
+    array = np.arange(2 * 3 * 3, dtype=np.float32).reshape((2, 3, 3))
+    image = _make_image_buffer(
+        array,
+        image_buffer_pb2.PixelType.PIXEL_POINT,
+        image_buffer_pb2.DataType.TYPE_32F,
+        num_channels=1,
+    )
+
+    result = image_utils.deserialize_image_buffer(image)
+
+    np.testing.assert_array_equal(result, array)
+    self.assertEqual(image.num_channels, 1)
+
+  def test_deserialize_image_buffer_rejects_invalid_buffer_size(self):
+    array = np.zeros((2, 3), dtype=np.uint16)
+    image = _make_image_buffer(
+        array,
+        image_buffer_pb2.PixelType.PIXEL_DEPTH,
+        image_buffer_pb2.DataType.TYPE_16U,
+        num_channels=1,
+    )
+    image.data = image.data[:-1]
+
+    with self.assertRaisesRegex(
+        ValueError, r"Invalid buffer size 11 != 12 bytes"
+    ):
+      image_utils.deserialize_image_buffer(image)
+
+  def test_deserialize_image_buffer_rejects_empty_data(self):
+    image = image_buffer_pb2.ImageBuffer(
+        num_channels=1, type=image_buffer_pb2.DataType.TYPE_8U
+    )
+
+    with self.assertRaisesRegex(ValueError, "No image buffer data provided"):
+      image_utils.deserialize_image_buffer(image)
+
+
+if __name__ == "__main__":
+  absltest.main()
@@ -327,13 +327,13 @@ class SkillExecutorServicer(skill_service_pb2_grpc.ExecutorServicer):
             f'Unexpected return type (expected: {want}, got: {got}).'
         )
 
-      if result is None:
-        result_any = None
-      else:
-        result_any = any_pb2.Any()
-        result_any.Pack(result)
+      # Pack into the response's own field rather than a separate Any, which
+      # would be copied again when passed to the constructor.
+      execute_result = skill_service_pb2.ExecuteResult()
+      if result is not None:
+        execute_result.result.Pack(result)
 
-      return skill_service_pb2.ExecuteResult(result=result_any)
+      return execute_result
 
     operation.start(op=execute, op_name='execute', log_context=request.context)
 
@@ -418,15 +418,13 @@ class SkillExecutorServicer(skill_service_pb2_grpc.ExecutorServicer):
             f'Unexpected return type (expected: {want}, got: {got}).'
         )
 
-      if result is None:
-        result_any = None
-      else:
-        result_any = any_pb2.Any()
-        result_any.Pack(result)
-
-      return skill_service_pb2.PreviewResult(
-          result=result_any, expected_states=skill_context.world_updates
+      preview_result = skill_service_pb2.PreviewResult(
+          expected_states=skill_context.world_updates
       )
+      if result is not None:
+        preview_result.result.Pack(result)
+
+      return preview_result
 
     operation.start(op=preview, op_name='preview', log_context=request.context)
 
@@ -3738,9 +3738,7 @@ def _add_to_transitive_file_descriptor_set(
   if fd.name in added_files:
     return fd_set
 
-  fd_proto = descriptor_pb2.FileDescriptorProto()
-  fd.CopyToProto(fd_proto)
-  fd_set.file.append(fd_proto)
+  fd.CopyToProto(fd_set.file.add())
   added_files.add(fd.name)
 
   for dep in fd.dependencies:
@@ -14,7 +14,6 @@ import uuid
 
 from google.protobuf import descriptor
 from google.protobuf import descriptor_pb2
-from google.protobuf import descriptor_pool
 from google.protobuf import message
 from intrinsic.executive.proto import behavior_call_pb2
 from intrinsic.skills.proto import skills_pb2
@@ -77,17 +76,21 @@ class SkillInfoImpl(provided.SkillInfo):
     # creation of each SkillBase class is hermetic. Ie., Skill A and Skill B
     # do not incidentally clash over the definition of a proto.
     parameter_description = self._skill_proto.parameter_description
-    file_descriptor_set = descriptor_pb2.FileDescriptorSet()
-    file_descriptor_set.MergeFrom(
-        parameter_description.parameter_descriptor_fileset
-    )
-    file_descriptor_set.MergeFrom(
-        self._skill_proto.return_value_description.descriptor_fileset
-    )
+    return_value_description = self._skill_proto.return_value_description
+    if not return_value_description.descriptor_fileset.file:
+      # Skills without a return value only need the parameter fileset, which
+      # can be used as is instead of copying it into a combined set.
+      file_descriptor_set = parameter_description.parameter_descriptor_fileset
+    else:
+      file_descriptor_set = descriptor_pb2.FileDescriptorSet()
+      file_descriptor_set.MergeFrom(
+          parameter_description.parameter_descriptor_fileset
+      )
+      file_descriptor_set.MergeFrom(return_value_description.descriptor_fileset)
 
-    desc_pool, message_classes = None, None
+    message_classes = None
     try:
-      desc_pool, message_classes = (
+      _, message_classes = (
           skill_utils.generate_proto_infra_from_filedescriptorset(
               file_descriptor_set
           )
@@ -121,7 +124,6 @@ class SkillInfoImpl(provided.SkillInfo):
       )
       raise e
 
-    self._message_pool: descriptor_pool.DescriptorPool = desc_pool
     self._message_classes: dict[str, Type[message.Message]] = message_classes
 
     self._field_names: Set[str] = set()
@@ -175,9 +177,9 @@ class SkillInfoImpl(provided.SkillInfo):
     ]
 
   def parameter_descriptor(self) -> descriptor.Descriptor:
-    return self._message_pool.FindMessageTypeByName(
-        self._skill_proto.parameter_description.parameter_message_full_name
-    )
+    # The message class was built from the pool, so its descriptor is the one
+    # the pool would return without another lookup.
+    return self.get_param_message_type().DESCRIPTOR
 
   @property
   def field_names(self) -> Set[str]:
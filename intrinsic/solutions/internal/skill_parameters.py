@@ -123,6 +123,7 @@ class SkillParameters:
 
   _default_message: message.Message
   _descriptor_proto: descriptor_pb2.DescriptorProto
+  _field_protos_by_name: dict[str, descriptor_pb2.FieldDescriptorProto]
 
   def __init__(
       self,
@@ -147,6 +148,11 @@ class SkillParameters:
     self._descriptor_proto = _get_descriptor(
         parameter_description, default_message.DESCRIPTOR.full_name
     )
+    # Keep the first field for each name to match the lookup semantics of
+    # _get_field_proto.
+    self._field_protos_by_name = {}
+    for field_proto in self._descriptor_proto.field:
+      self._field_protos_by_name.setdefault(field_proto.name, field_proto)
 
   def _get_field_proto(
       self, field_name: str
@@ -159,14 +165,7 @@ class SkillParameters:
     Raises:
       NameError: if the request field name cannot be found.
     """
-    field_proto = next(
-        (
-            field_proto
-            for field_proto in self._descriptor_proto.field
-            if field_proto.name == field_name
-        ),
-        None,
-    )
+    field_proto = self._field_protos_by_name.get(field_name)
     if not field_proto:
       raise NameError(
           "Field proto for field with name '{}' could not be found.".format(
@@ -49,6 +49,9 @@ _PROTO_PACKAGE_SEPARATOR = "."
 
 RESOURCE_SLOT_DECONFLICT_SUFFIX = "_resource"
 
+# Python package under which generated skill classes are placed.
+_SKILLS_PYTHON_PACKAGE = __name__.replace(".internal.skill_utils", ".skills")
+
 
 def module_for_generated_skill(skill_package: str) -> str:
   """Generates the module name for a generated skill class.
@@ -61,11 +64,10 @@ def module_for_generated_skill(skill_package: str) -> str:
   Returns:
     A module name string, e.g., 'intrinsic.solutions.skills.ai.intrinsic'.
   """
-  skills_python_package = __name__.replace(".internal.skill_utils", ".skills")
   if skill_package:
-    return skills_python_package + "." + skill_package
+    return _SKILLS_PYTHON_PACKAGE + "." + skill_package
   else:
-    return skills_python_package
+    return _SKILLS_PYTHON_PACKAGE
 
 
 @dataclasses.dataclass
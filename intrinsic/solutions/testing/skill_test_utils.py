@@ -21,10 +21,23 @@ from intrinsic.solutions.testing import test_skill_params_pb2
 
 FLAGS = flags.FLAGS
 
+# Cache used by _read_message_from_pbbin_file. Test cases typically create a
+# new SkillTestUtils in every setUp() for the same file, which then only needs
+# to be read and parsed once per test binary.
+_file_descriptor_set_cache: dict[str, descriptor_pb2.FileDescriptorSet] = {}
+
 
 def _read_message_from_pbbin_file(filename):
+  try:
+    return _file_descriptor_set_cache[filename]
+  except KeyError:
+    pass
   with open(filename, 'rb') as fileobj:
-    return descriptor_pb2.FileDescriptorSet.FromString(fileobj.read())
+    file_descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(
+        fileobj.read()
+    )
+  _file_descriptor_set_cache[filename] = file_descriptor_set
+  return file_descriptor_set
 
 
 def _get_test_message_file_descriptor_set(
@@ -70,15 +70,25 @@ def _append_file_descriptor_set_to_pool(
   # like "Message.field: 'FieldType' seems to be defined in 'file.proto',
   # which is not imported by '#.proto'.  To use it here, please add the
   # necessary import"
-  def add_file(file_proto: descriptor_pb2.FileDescriptorProto):
-    for dependency in file_proto.dependency:
-      if dependency in file_by_name:
-        # Remove from elements to be visited, in order to cut cycles.
-        add_file(file_by_name.pop(dependency))
-    pool.Add(file_proto)
-
+  # The files are visited with an explicit depth-first stack rather than
+  # recursion so that long dependency chains cannot exceed the recursion limit.
   while file_by_name:
-    add_file(file_by_name.popitem()[1])
+    root = file_by_name.popitem()[1]
+    stack = [(root, iter(root.dependency))]
+    while stack:
+      file_proto, dependencies = stack[-1]
+      for dependency in dependencies:
+        if dependency in file_by_name:
+          # Remove from elements to be visited, in order to cut cycles.
+          dependency_proto = file_by_name.pop(dependency)
+          stack.append((dependency_proto, iter(dependency_proto.dependency)))
+          break
+      else:
+        # All dependencies have been added, so the file itself can be added.
+        stack.pop()
+        # Hand the pool the wire format directly; Add() would serialize the
+        # proto internally before building the descriptor.
+        pool.AddSerializedFile(file_proto.SerializeToString())
 
 
 def create_descriptor_pool(
@@ -380,15 +380,18 @@ class WorldObject(TransformNode):
     Returns:
       The child with child_name that belongs to the object
     """
-    child_id = next(
-        child.id for child in self._proto.children if child.name == child_name
-    )
-    request = object_world_service_pb2.GetObjectRequest(
-        world_id=self._proto.world_id,
-        object=object_world_refs_pb2.ObjectReference(id=child_id),
-        view=object_world_updates_pb2.ObjectView.FULL,
+    for child in self._proto.children:
+      if child.name == child_name:
+        request = object_world_service_pb2.GetObjectRequest(
+            world_id=self._proto.world_id,
+            object=object_world_refs_pb2.ObjectReference(id=child.id),
+            view=object_world_updates_pb2.ObjectView.FULL,
+        )
+        return self._stub.GetObject(request)
+    raise ValueError(
+        f'Child with name "{child_name}" of the object "{self.name}" does not'
+        ' exist.'
     )
-    return self._stub.GetObject(request)
 
   @property
   def parent_name(self) -> object_world_ids.WorldObjectName:
@@ -344,6 +344,24 @@ my_object: WorldObject(id=15)
         'child_object',
     )
 
+  def test_get_unknown_child_proto_raises_value_error(self):
+    object_proto = self._create_world_object_proto(name='test_object')
+    object_proto.children.append(
+        object_world_service_pb2.IdAndName(name='child_object', id='child_id')
+    )
+
+    with self.assertRaises(ValueError) as e:
+      self._create_world_object(object_proto)._get_child_proto(
+          object_world_ids.WorldObjectName('unknown')
+      )
+
+    self.assertEqual(
+        str(e.exception),
+        'Child with name "unknown" of the object "test_object" does not'
+        ' exist.',
+    )
+    self._stub.GetObject.assert_not_called()
+
   def test_get_unknown_frame_attribute_raises_attribute_error(self):
     with self.assertRaises(AttributeError) as e:
       _ = self._create_world_object(self._create_world_object_proto()).unknown